@@ -2,23 +2,55 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+import urllib.error
 import urllib.request
 import calendar
+import email.utils
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
+try:
+    import urllib3  # type: ignore
+except Exception:
+    # Optional: fall back to plain urllib (one fresh connection per request).
+    urllib3 = None
+
 # Auto-update for the PyInstaller onefile Windows build.
 # Normal mode: on startup, check GitHub releases for the latest .exe asset and update if needed.
 # Updater mode: invoked as a *separate* executable copy so it can replace the original exe.
 
 GITHUB_REPO = "Lionkjgame1219/Chiv2AdminDashboard"
-GITHUB_RELEASES_API = f"https://api.github.com/repos/{GITHUB_REPO}/releases?per_page=100"
+GITHUB_RELEASES_API = f"https://api.github.com/repos/{GITHUB_REPO}/releases?per_page=10"
 APPDATA_DIRNAME = "Chiv2AdminDashboard"
+USER_AGENT = "Chiv2AdminDashboard-Autoupdater"
+# Relaunching within this window reuses the cached releases list without any request.
+RELEASES_CACHE_TTL_S = 10 * 60
+
+
+def _make_pool_manager():
+    # Shared keep-alive pool: the releases call and the asset download reuse connections
+    # instead of paying a TCP + TLS handshake per request.
+    if urllib3 is None:
+        return None
+    try:
+        return urllib3.PoolManager(
+            maxsize=4,
+            retries=urllib3.Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+    except Exception:
+        return None
+
+
+_http = _make_pool_manager()
 
 
 def _safe_status(cb: Optional[Callable[[str], None]], msg: str) -> None:
@@ -68,17 +100,32 @@ def _maybe_make_qt_progress_ui(title: str = "Updating..."):
             pass
         app.processEvents()
 
-        def _set_status(msg: str) -> None:
-            label.setText(str(msg))
+        # Widgets are updated immediately; only the event loop pump is throttled to ~10 times per
+        # second for progress ticks. A status change always repaints so a phase like "Installing
+        # update..." shows even if nothing follows it for a while.
+        # (A QTimer can't do this: the download runs on this same thread, so it would never fire.)
+        last_pump = [0.0]
+
+        def _pump(force: bool = False) -> None:
+            now = time.monotonic()
+            if not force and (now - last_pump[0]) < 0.1:
+                return
+            last_pump[0] = now
             app.processEvents()
 
+        def _set_status(msg: str) -> None:
+            msg = str(msg)
+            changed = label.text() != msg
+            label.setText(msg)
+            _pump(force=changed)
+
         def _set_progress(percent: Optional[int]) -> None:
             if percent is None:
                 bar.setRange(0, 0)
             else:
                 bar.setRange(0, 100)
                 bar.setValue(int(percent))
-            app.processEvents()
+            _pump()
 
         def _close() -> None:
             try:
@@ -113,8 +160,14 @@ def _load_state() -> dict:
 
 def _save_state(state: dict) -> None:
     try:
-        with open(_state_path(), "w", encoding="utf-8") as f:
-            json.dump(state or {}, f, indent=2)
+        path = _state_path()
+        data = json.dumps(state or {}, indent=2)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
     except Exception:
         pass
 
@@ -122,26 +175,109 @@ def _save_state(state: dict) -> None:
 _semver_re = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?")
 
 
-def parse_semver(text: str):
-    if not text:
-        return None
-    m = _semver_re.search(str(text))
+@functools.lru_cache(maxsize=512)
+def _parse_semver_cached(text: str):
+    # Tags are usually "v1.2.3": try an anchored match first, then search anywhere
+    # (asset names like "AdminDashboard-1.2.3.exe").
+    m = _semver_re.match(text.lstrip("vV")) or _semver_re.search(text)
     if not m:
         return None
     a, b, c, d = m.groups()
     return (int(a), int(b), int(c), int(d or 0))
 
 
-def _http_json(url: str, timeout_s: float = 5.0):
-    req = urllib.request.Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "Chiv2AdminDashboard-Autoupdater",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+def parse_semver(text: str):
+    if not text:
+        return None
+    return _parse_semver_cached(str(text))
+
+
+def _http_json(url: str, timeout_s: float = 5.0, headers: Optional[dict] = None):
+    """GET a JSON document.
+
+    Returns a tuple (data, response_headers); data is None when the server answered
+    304 Not Modified to a conditional request.
+    """
+
+    req_headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": USER_AGENT,
+    }
+    req_headers.update(headers or {})
+    if _http is not None:
+        resp = _http.request("GET", url, headers=req_headers, timeout=urllib3.Timeout(connect=5.0, read=timeout_s))
+        if resp.status == 304:
+            return None, resp.headers
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} while fetching {url}")
+        return json.loads(resp.data.decode("utf-8")), resp.headers
+
+    req = urllib.request.Request(url, headers=req_headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return json.loads(resp.read().decode("utf-8")), resp.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, e.headers
+        raise
+
+
+def _slim_releases(releases):
+    # Only keep the fields find_latest_exe_asset() reads, so the cached copy in the state file stays small.
+    slim = []
+    for rel in releases or []:
+        slim.append(
+            {
+                "tag_name": rel.get("tag_name"),
+                "draft": bool(rel.get("draft")),
+                "prerelease": bool(rel.get("prerelease")),
+                "assets": [
+                    {
+                        "name": a.get("name"),
+                        "browser_download_url": a.get("browser_download_url"),
+                        "updated_at": a.get("updated_at"),
+                    }
+                    for a in rel.get("assets") or []
+                ],
+            }
+        )
+    return slim
+
+
+def _fetch_releases(state: dict, timeout_s: float = 5.0):
+    """Return the GitHub releases list, reusing the copy cached in *state* when possible.
+
+    Within RELEASES_CACHE_TTL_S of the last check no request is made at all. Otherwise the
+    stored ETag / Last-Modified validators are sent, so an unchanged list costs a bodyless 304.
+    *state* is updated in place; the caller is responsible for saving it.
+    """
+
+    cached = state.get("releases_cached")
+    if cached is not None:
+        try:
+            checked_at = float(state.get("releases_checked_at") or 0)
+            if 0 <= (time.time() - checked_at) < RELEASES_CACHE_TTL_S:
+                return cached
+        except Exception:
+            pass
+
+    headers = {}
+    if cached is not None:
+        if state.get("releases_etag"):
+            headers["If-None-Match"] = str(state["releases_etag"])
+        if state.get("releases_last_modified"):
+            headers["If-Modified-Since"] = str(state["releases_last_modified"])
+
+    data, resp_headers = _http_json(GITHUB_RELEASES_API, timeout_s=timeout_s, headers=headers)
+    state["releases_checked_at"] = time.time()
+    if data is None:
+        return cached
+
+    releases = _slim_releases(data)
+    state["releases_cached"] = releases
+    state["releases_etag"] = resp_headers.get("ETag")
+    state["releases_last_modified"] = resp_headers.get("Last-Modified")
+    return releases
 
 
 def find_latest_exe_asset(releases, preferred_filename: str = ""):
@@ -162,8 +298,31 @@ def find_latest_exe_asset(releases, preferred_filename: str = ""):
                     continue
                 yield rel, a, tag_ver
 
+    def as_pick(rel, asset, v):
+        return {
+            "asset_name": asset.get("name"),
+            "download_url": asset.get("browser_download_url"),
+            "version_tuple": v,
+            "release_tag": rel.get("tag_name"),
+        }
+
+    # Fast path: releases come newest-first, so the first stable release shipping an exe with
+    # exactly our filename is the answer; no need to rank every asset. Only taken when that asset
+    # carries a version: unversioned ones (e.g. a "nightly" tag) must go through the full ranking,
+    # which prefers versioned assets.
+    if preferred_lc:
+        for rel, asset, tag_ver in candidates(False):
+            name = asset.get("name") or ""
+            if name.lower() == preferred_lc:
+                v = parse_semver(name) or tag_ver
+                if v is not None:
+                    return as_pick(rel, asset, v)
+                break
+
     best = None
+    ranked = []
     for allow_pre in (False, True):
+        ranked = []
         for rel, asset, tag_ver in candidates(allow_pre):
             name = asset.get("name") or ""
             v = parse_semver(name) or tag_ver
@@ -182,6 +341,7 @@ def find_latest_exe_asset(releases, preferred_filename: str = ""):
                 prefer = 0
 
             key = (prefer, v is not None, v or (0, 0, 0, 0), asset.get("updated_at") or "")
+            ranked.append((key, rel, asset, v))
             if best is None or key > best[0]:
                 best = (key, rel, asset, v)
         if best is not None:
@@ -189,13 +349,47 @@ def find_latest_exe_asset(releases, preferred_filename: str = ""):
 
     if best is None:
         return None
+
+    # Several assets tie on everything but updated_at and at least one lacks it:
+    # ask the server for Last-Modified instead of picking arbitrarily.
+    ties = [entry for entry in ranked if entry[0][:3] == best[0][:3]]
+    if len(ties) > 1 and any(not entry[2].get("updated_at") for entry in ties):
+        best = _break_tie_by_last_modified(ties) or best
+
     _, rel, asset, v = best
-    return {
-        "asset_name": asset.get("name"),
-        "download_url": asset.get("browser_download_url"),
-        "version_tuple": v,
-        "release_tag": rel.get("tag_name"),
-    }
+    return as_pick(rel, asset, v)
+
+
+def _http_last_modified(url: str, timeout_s: float = 5.0):
+    """HEAD *url* and return its Last-Modified header as an epoch float, or None."""
+
+    if not url:
+        return None
+    headers = {"User-Agent": USER_AGENT}
+    try:
+        if _http is not None:
+            resp = _http.request("HEAD", url, headers=headers, timeout=urllib3.Timeout(connect=5.0, read=timeout_s))
+            value = resp.headers.get("Last-Modified") if resp.status < 400 else None
+        else:
+            req = urllib.request.Request(url, headers=headers, method="HEAD")
+            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+                value = resp.headers.get("Last-Modified")
+        if not value:
+            return None
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except Exception:
+        return None
+
+
+def _break_tie_by_last_modified(ties):
+    urls = [entry[2].get("browser_download_url") for entry in ties]
+    # Rare path (ambiguous release assets); a small bounded pool keeps it from serialising on RTTs.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        stamps = list(pool.map(_http_last_modified, urls))
+    dated = [(ts, i) for i, ts in enumerate(stamps) if ts is not None]
+    if not dated:
+        return None
+    return ties[max(dated)[1]]
 
 
 def _get_file_version_tuple(path: str):
@@ -244,15 +438,96 @@ def _installed_recently(state: dict, window_s: float = 15 * 60) -> bool:
         return False
 
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+class _ProgressReader:
+    """File-like wrapper over an HTTP response that reports download progress from read().
+
+    Lets shutil.copyfileobj() drive the socket -> file copy while callbacks stay throttled.
+    """
+
+    def __init__(
+        self,
+        resp,
+        total: Optional[int],
+        status_callback: Optional[Callable[[str], None]] = None,
+        progress_callback: Optional[Callable[[Optional[int]], None]] = None,
+        interval_s: float = 0.5,
+    ) -> None:
+        self._resp = resp
+        self.total = total
+        self.downloaded = 0
+        self._status_callback = status_callback
+        self._progress_callback = progress_callback
+        self._interval_s = interval_s
+        self._last_t = 0.0
+
+    def read(self, n: int = -1) -> bytes:
+        chunk = self._resp.read(n)
+        if chunk:
+            self.downloaded += len(chunk)
+            now = time.time()
+            if (now - self._last_t) >= self._interval_s:
+                self._last_t = now
+                self._report()
+        return chunk
+
+    def _report(self) -> None:
+        total = self.total
+        downloaded = self.downloaded
+        pct = None
+        if total and total > 0:
+            pct = int(downloaded * 100 / total)
+        if self._progress_callback:
+            try:
+                self._progress_callback(pct)
+            except Exception:
+                pass
+        if self._status_callback:
+            mb = 1024 * 1024
+            if total and total > 0:
+                _safe_status(
+                    self._status_callback,
+                    f"Downloading update... {downloaded / mb:.1f} / {total / mb:.1f} MB ({pct}%)",
+                )
+            else:
+                _safe_status(self._status_callback, f"Downloading update... {downloaded / mb:.1f} MB")
+
+    def finish(self) -> None:
+        if self._progress_callback and self.total:
+            try:
+                self._progress_callback(100)
+            except Exception:
+                pass
+
+
 def _download(
     url: str,
     out_path: str,
-    timeout_s: float = 300.0,
+    timeout_s: float = 30.0,
     status_callback: Optional[Callable[[str], None]] = None,
     progress_callback: Optional[Callable[[Optional[int]], None]] = None,
 ) -> None:
-    req = urllib.request.Request(url, headers={"User-Agent": "Chiv2AdminDashboard-Autoupdater"})
-    with urllib.request.urlopen(req, timeout=timeout_s) as r, open(out_path, "wb") as f:
+    # timeout_s bounds each socket read (a stall), not the whole transfer, so slow links still finish.
+    headers = {"User-Agent": USER_AGENT}
+    if _http is not None:
+        r = _http.request(
+            "GET",
+            url,
+            headers=headers,
+            preload_content=False,
+            timeout=urllib3.Timeout(connect=10.0, read=timeout_s),
+        )
+        if r.status >= 400:
+            r.release_conn()
+            raise RuntimeError(f"HTTP {r.status} while downloading {url}")
+        close = r.release_conn
+    else:
+        r = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout_s)
+        close = r.close
+
+    try:
         total = None
         try:
             cl = r.headers.get("Content-Length")
@@ -261,53 +536,58 @@ def _download(
         except Exception:
             total = None
 
-        downloaded = 0
-        last_t = 0.0
-        while True:
-            chunk = r.read(1024 * 256)
-            if not chunk:
-                break
-            f.write(chunk)
+        reader = _ProgressReader(r, total, status_callback, progress_callback)
+        with open(out_path, "wb") as f:
+            shutil.copyfileobj(reader, f, length=DOWNLOAD_CHUNK_SIZE)
+        reader.finish()
+    finally:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+MOVEFILE_REPLACE_EXISTING = 0x1
+MOVEFILE_WRITE_THROUGH = 0x8
+REPLACEFILE_WRITE_THROUGH = 0x1
+ERROR_ACCESS_DENIED = 5
 
-            downloaded += len(chunk)
-            now = time.time()
-            if (now - last_t) >= 0.5:
-                last_t = now
-                pct = None
-                if total and total > 0:
-                    pct = int(downloaded * 100 / total)
-                if progress_callback:
-                    try:
-                        progress_callback(pct)
-                    except Exception:
-                        pass
-                if status_callback:
-                    mb = 1024 * 1024
-                    if total and total > 0:
-                        _safe_status(
-                            status_callback,
-                            f"Downloading update... {downloaded / mb:.1f} / {total / mb:.1f} MB ({pct}%)",
-                        )
-                    else:
-                        _safe_status(status_callback, f"Downloading update... {downloaded / mb:.1f} MB")
-
-        if progress_callback and total:
-            try:
-                progress_callback(100)
-            except Exception:
-                pass
+
+def _win32_replace(src: str, dst: str) -> bool:
+    """Single-shot replace via MoveFileExW, then ReplaceFileW if dst is locked. Windows only."""
+
+    if os.name != "nt":
+        return False
+    try:
+        import ctypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        if kernel32.MoveFileExW(src, dst, MOVEFILE_REPLACE_EXISTING | MOVEFILE_WRITE_THROUGH):
+            return True
+        if ctypes.get_last_error() == ERROR_ACCESS_DENIED and os.path.exists(dst):
+            if kernel32.ReplaceFileW(dst, src, None, REPLACEFILE_WRITE_THROUGH, None, None):
+                return True
+    except Exception:
+        pass
+    return False
 
 
 def _replace_with_retry(src: str, dst: str, timeout_s: float = 60.0) -> None:
+    if _win32_replace(src, dst):
+        return
+
+    # Still locked (e.g. the old process hasn't exited yet): poll with exponential backoff.
     deadline = time.time() + float(timeout_s)
     last_err = None
+    attempt = 0
     while time.time() < deadline:
         try:
             os.replace(src, dst)
             return
         except Exception as e:
             last_err = e
-            time.sleep(0.5)
+            time.sleep(min(0.05 * (2 ** attempt), 2.0))
+            attempt += 1
     raise last_err  # type: ignore
 
 
@@ -407,130 +687,177 @@ def _run_apply_update(
         pass
 
 
-def handle_update_flow(argv=None, status_callback: Optional[Callable[[str], None]] = None) -> bool:
-    argv = list(argv or sys.argv[1:])
+def _check_for_update(status_callback: Optional[Callable[[str], None]] = None):
+    """Network-bound half of the normal-mode flow.
 
-    # Updater mode
-    if "--apply-update" in argv:
-        # In updater mode, show a minimal progress window if possible (packaged app has no console).
-        ui_status = ui_progress = ui_close = None
-        if status_callback is None:
-            ui_status, ui_progress, ui_close = _maybe_make_qt_progress_ui(title="Updating AdminDashboard")
-            status_callback = ui_status
+    Returns the picked release asset (a dict, with the comparison "remote_id" added) when an
+    update should be applied, else None. Safe to run off the main thread: it never touches Qt.
+    """
+
+    _safe_status(status_callback, "Checking for updates...")
+    st = _load_state()
+    releases = _fetch_releases(st, timeout_s=5.0)
+    _save_state(st)
+    pick = find_latest_exe_asset(releases, preferred_filename=os.path.basename(sys.executable))
+    if not pick or not pick.get("download_url"):
+        return None
+
+    exe_path = sys.executable
+    current_v = _get_file_version_tuple(exe_path)
+    remote_v = pick.get("version_tuple")
+
+    installed_id = st.get("installed_remote_id") or st.get("installed_remote_version")
+
+    # Compare using a consistent remote id:
+    # - Prefer a semver extracted from asset name/tag
+    # - Fall back to the release tag
+    remote_id = None
+    if remote_v:
         try:
-            _run_apply_update(argv, status_callback=status_callback, progress_callback=ui_progress)
-        finally:
-            if ui_close:
-                ui_close()
-        return True
+            remote_id = ".".join(map(str, tuple(remote_v)))
+        except Exception:
+            remote_id = str(remote_v)
+    if not remote_id:
+        remote_id = pick.get("release_tag") or None
+
+    # Loop prevention: if we already installed this remote_id onto *this* executable,
+    # don't keep applying the same update again.
+    cur_size, cur_mtime = _exe_fingerprint(exe_path)
+    st_size = st.get("installed_exe_size")
+    st_mtime = st.get("installed_exe_mtime")
+    fingerprint_matches = (
+        cur_size is not None
+        and cur_mtime is not None
+        and st_size is not None
+        and st_mtime is not None
+        and int(st_size) == int(cur_size)
+        and int(st_mtime) == int(cur_mtime)
+    )
 
-    # Normal mode (only for the packaged exe)
-    if (not _is_frozen()) or ("--skip-update" in argv):
-        return False
+    # If the file timestamp changes (e.g. antivirus / copy / restore), the fingerprint may not match.
+    # If we recorded what file version we *saw* right after installing, use that as an additional
+    # lightweight signal that we're still running the installed exe.
+    state_local_v = st.get("installed_local_file_version")
+    version_matches_state = bool(state_local_v) and (_format_version(current_v) == str(state_local_v))
+
+    already_installed = (
+        remote_id is not None
+        and installed_id is not None
+        and str(remote_id) == str(installed_id)
+        and (fingerprint_matches or version_matches_state or _installed_recently(st))
+    )
 
-    try:
-        _safe_status(status_callback, "Checking for updates...")
-        releases = _http_json(GITHUB_RELEASES_API, timeout_s=5.0)
-        pick = find_latest_exe_asset(releases, preferred_filename=os.path.basename(sys.executable))
-        if not pick or not pick.get("download_url"):
-            return False
+    _safe_status(
+        status_callback,
+        f"Current version: {_format_version(current_v)} | Latest: {_format_version(remote_v)}",
+    )
 
-        exe_path = sys.executable
-        current_v = _get_file_version_tuple(exe_path)
-        remote_v = pick.get("version_tuple")
-        st = _load_state()
+    if remote_v is None and installed_id == pick.get("release_tag"):
+        return None
 
-        installed_id = st.get("installed_remote_id") or st.get("installed_remote_version")
+    needs = False
+    if already_installed:
+        # We have high confidence we already applied this exact update to this exe.
+        # (Prevents infinite loops when file version metadata doesn't change.)
+        needs = False
+    elif current_v and remote_v:
+        needs = tuple(remote_v) > tuple(current_v)
+    elif remote_v:
+        # No readable local file version -> rely on state/fingerprint.
+        needs = (str(remote_id) != str(installed_id)) or (not fingerprint_matches)
+    else:
+        needs = pick.get("release_tag") != installed_id
+
+    if not needs:
+        _safe_status(status_callback, "No updates available.")
+        return None
 
-        # Compare using a consistent remote id:
-        # - Prefer a semver extracted from asset name/tag
-        # - Fall back to the release tag
-        remote_id = None
-        if remote_v:
-            try:
-                remote_id = ".".join(map(str, tuple(remote_v)))
-            except Exception:
-                remote_id = str(remote_v)
-        if not remote_id:
-            remote_id = pick.get("release_tag") or None
-
-        # Loop prevention: if we already installed this remote_id onto *this* executable,
-        # don't keep applying the same update again.
-        cur_size, cur_mtime = _exe_fingerprint(exe_path)
-        st_size = st.get("installed_exe_size")
-        st_mtime = st.get("installed_exe_mtime")
-        fingerprint_matches = (
-            cur_size is not None
-            and cur_mtime is not None
-            and st_size is not None
-            and st_mtime is not None
-            and int(st_size) == int(cur_size)
-            and int(st_mtime) == int(cur_mtime)
-        )
+    pick = dict(pick)
+    pick["remote_id"] = remote_id
+    return pick
 
-        # If the file timestamp changes (e.g. antivirus / copy / restore), the fingerprint may not match.
-        # If we recorded what file version we *saw* right after installing, use that as an additional
-        # lightweight signal that we're still running the installed exe.
-        state_local_v = st.get("installed_local_file_version")
-        version_matches_state = bool(state_local_v) and (_format_version(current_v) == str(state_local_v))
-
-        already_installed = (
-            remote_id is not None
-            and installed_id is not None
-            and str(remote_id) == str(installed_id)
-            and (fingerprint_matches or version_matches_state or _installed_recently(st))
-        )
 
-        _safe_status(
-            status_callback,
-            f"Current version: {_format_version(current_v)} | Latest: {_format_version(remote_v)}",
-        )
+def spawn_updater(pick: dict, argv=None, status_callback: Optional[Callable[[str], None]] = None) -> bool:
+    """Launch the updater process for a pick returned by the update check.
 
-        if remote_v is None and installed_id == pick.get("release_tag"):
-            return False
+    Returns True once the updater has been started; the caller should then exit so the
+    original executable can be replaced.
+    """
 
-        needs = False
-        if already_installed:
-            # We have high confidence we already applied this exact update to this exe.
-            # (Prevents infinite loops when file version metadata doesn't change.)
-            needs = False
-        elif current_v and remote_v:
-            needs = tuple(remote_v) > tuple(current_v)
-        elif remote_v:
-            # No readable local file version -> rely on state/fingerprint.
-            needs = (str(remote_id) != str(installed_id)) or (not fingerprint_matches)
-        else:
-            needs = pick.get("release_tag") != installed_id
+    argv = list(argv or sys.argv[1:])
+    exe_path = sys.executable
+    # Spawn updater from a temp copy of ourselves so the original exe can be replaced.
+    tmp = tempfile.gettempdir()
+    updater = os.path.join(tmp, f"Chiv2AdminDashboard_updater_{os.getpid()}.exe")
+    try:
+        shutil.copy2(exe_path, updater)
+    except Exception:
+        return False
 
-        if not needs:
-            _safe_status(status_callback, "No updates available.")
-            return False
+    # IMPORTANT: keep this consistent with the comparison logic in _check_for_update().
+    remote_ver_s = pick.get("remote_id") or ""
+    cmd = [
+        updater,
+        "--apply-update",
+        "--url",
+        str(pick["download_url"]),
+        "--target",
+        exe_path,
+        "--remote-version",
+        remote_ver_s,
+        "--",
+    ] + argv
+
+    subprocess.Popen(cmd, close_fds=True)
+    _safe_status(status_callback, "Update found. Starting updater...")
+    return True
+
+
+def start_update_check(argv=None):
+    """Run the update check on a daemon thread so the UI can start right away.
+
+    Returns a queue.Queue that receives exactly one item (the pick to pass to spawn_updater(),
+    or None when no update is needed or the check failed), or None if update checks don't
+    apply to this run (source run, --skip-update, updater mode).
+    """
+
+    argv = list(argv or sys.argv[1:])
+    if "--apply-update" in argv or (not _is_frozen()) or ("--skip-update" in argv):
+        return None
+
+    result: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=1)
 
-        # Spawn updater from a temp copy of ourselves so the original exe can be replaced.
-        tmp = tempfile.gettempdir()
-        updater = os.path.join(tmp, f"Chiv2AdminDashboard_updater_{os.getpid()}.exe")
+    def _worker() -> None:
+        pick = None
         try:
-            shutil.copy2(exe_path, updater)
+            pick = _check_for_update()
         except Exception:
-            return False
+            pick = None
+        result.put(pick)
+
+    threading.Thread(target=_worker, name="autoupdate-check", daemon=True).start()
+    return result
 
-        # IMPORTANT: keep this consistent with the comparison logic above.
-        remote_ver_s = remote_id or ""
-        cmd = [
-            updater,
-            "--apply-update",
-            "--url",
-            str(pick["download_url"]),
-            "--target",
-            exe_path,
-            "--remote-version",
-            remote_ver_s,
-            "--",
-        ] + argv
-
-        subprocess.Popen(cmd, close_fds=True)
-        _safe_status(status_callback, "Update found. Starting updater...")
+
+def handle_update_flow(argv=None, status_callback: Optional[Callable[[str], None]] = None) -> bool:
+    """Run the updater process (--apply-update). Returns False when not in updater mode.
+
+    Normal runs check for updates in the background via start_update_check() instead.
+    """
+    argv = list(argv or sys.argv[1:])
+
+    # Updater mode
+    if "--apply-update" in argv:
+        # In updater mode, show a minimal progress window if possible (packaged app has no console).
+        ui_status = ui_progress = ui_close = None
+        if status_callback is None:
+            ui_status, ui_progress, ui_close = _maybe_make_qt_progress_ui(title="Updating AdminDashboard")
+            status_callback = ui_status
+        try:
+            _run_apply_update(argv, status_callback=status_callback, progress_callback=ui_progress)
+        finally:
+            if ui_close:
+                ui_close()
         return True
-    except Exception:
-        return False
 
+    return False
@@ -1,8 +1,18 @@
 """Provides a class encapsulating a chivalry 2 instance"""
 
 import win32gui, win32process, win32api
-from time import sleep
-from . import inputLib
+from time import sleep, monotonic
+from . import inputLib, localconfig
+
+def _parsePresets(lines):
+    """Return {slot: payload} for the non-empty preset lines of localconfig."""
+    base = localconfig.PRESET_BASE_INDEX
+    preset_lines = lines[base:base + localconfig.PRESET_COUNT]
+    return {i: line for i, line in enumerate(preset_lines) if line.strip()}
+
+def _getPresets():
+    """Return the {slot: payload} dict from the cached localconfig."""
+    return _parsePresets(localconfig.read_lines())
 
 class Chivalry:
     """Class representing a running instance of the Chivalry 2 game.
@@ -18,21 +28,24 @@ class Chivalry:
                                on this machine.")
 
 
-    __windowHandle = -1
+    _windowHandle = 0
     def getChivalryWindowHandle(self):
         """Obtains and returns the win32 window handle of a chivalry 2 process running on this computer.
         
-        This function will only make the associated syscalls once. After that, the cached window handle from the
-            first call will be returned instead, regardless of it's validity.
+        The handle is cached on the class, so every Chivalry instance shares it (the dashboard creates
+            many short-lived instances). The lookup and its warmup delay are only repeated once the cached
+            window no longer exists, e.g. after the game was restarted.
         """
-        if self.__windowHandle != -1:
-            return self.__windowHandle
-        else:
-            hwnd = win32gui.FindWindow(None, "Chivalry 2  ") #note the spaces after the 2 here. They're important.
-            self.__windowHandle = hwnd
-            sleep(0.1) #window handle doesn't seem to be valid until after a warmup period
+        hwnd = Chivalry._windowHandle
+        if hwnd and win32gui.IsWindow(hwnd):
             return hwnd
 
+        hwnd = win32gui.FindWindow(None, "Chivalry 2  ") #note the spaces after the 2 here. They're important.
+        Chivalry._windowHandle = hwnd
+        if hwnd:
+            sleep(0.1) #window handle doesn't seem to be valid until after a warmup period
+        return hwnd
+
     def getFocus(self, hwnd):
         """Give the chivalry 2 window user focus."""
         remote_thread, _ = win32process.GetWindowThreadProcessId(hwnd)
@@ -42,6 +55,27 @@ class Chivalry:
 
 
 
+    def waitForForeground(self, hwnd, timeout=0.2):
+        """Wait until hwnd is the foreground window, or until timeout seconds have passed.
+
+        Polls with an exponentially growing interval (1 ms up to 20 ms), so the common case of the
+            window already being focused returns right away without giving up a full scheduler slice.
+
+        @returns: True if the window is in the foreground
+        """
+        deadline = monotonic() + timeout
+        delay = 0.001
+        try:
+            while win32gui.GetForegroundWindow() != hwnd:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.02)
+            return True
+        except Exception:
+            return False
+
     def consoleSend(self, message):
         """Send a command to the chivalry console.
 
@@ -50,15 +84,7 @@ class Chivalry:
         hwnd = self.getChivalryWindowHandle()
         print(f"[CONSOLESEND] Game window handle: {hwnd}")
         self.getFocus(hwnd)
-
-        try:
-            import win32gui
-            for _ in range(40):
-                if win32gui.GetForegroundWindow() == hwnd:
-                    break
-                sleep(0.005)
-        except Exception:
-            pass
+        self.waitForForeground(hwnd)
 
         try:
             inputLib.clearInputLine()
@@ -66,7 +92,7 @@ class Chivalry:
             pass
 
         print(f"[CONSOLESEND] Sending command: '{message}'")
-        success = inputLib.sendString(message)
+        success = inputLib.sendStringFast(message)
 
         if success:
             print("[CONSOLESEND] Command sent successfully")
@@ -82,15 +108,7 @@ class Chivalry:
         hwnd = self.getChivalryWindowHandle()
         print(f"[OPENCONSOLE] Game window handle: {hwnd}")
         self.getFocus(hwnd)
-
-        try:
-            import win32gui
-            for _ in range(40):
-                if win32gui.GetForegroundWindow() == hwnd:
-                    break
-                sleep(0.005)
-        except Exception:
-            pass
+        self.waitForForeground(hwnd)
 
         print("[OPENCONSOLE] Sending console key...")
         success = inputLib.sendConsoleKey()
@@ -105,37 +123,27 @@ class Chivalry:
     def SavePreset(self, slot, payload):
         """Save a preset to a slot.
 
+        The file is only rewritten when the slot's content actually changes, and the rewrite
+        goes through a temporary file so a crash can't truncate localconfig.
+
         @param slot: The slot to save to (0-9)
         @param payload: The reason text or combined reason/duration to save
         """
-        import os
-
-        localconfig = "localconfig"
-
-        lines = []
-        if os.path.exists(localconfig):
-            try:
-                with open(localconfig, 'r', encoding='utf-8') as f:
-                    lines = f.read().splitlines()
-            except Exception:
-                lines = []
+        payload = payload if payload is not None else ""
+        lines = localconfig.read_lines()
+        if (_parsePresets(lines).get(int(slot)) or "") == payload:
+            return True
 
-        min_len = 13
+        min_len = localconfig.PRESET_BASE_INDEX + localconfig.PRESET_COUNT
         if len(lines) < min_len:
             lines += [""] * (min_len - len(lines))
 
-        preset_index = 3 + int(slot)
+        preset_index = localconfig.PRESET_BASE_INDEX + int(slot)
         if len(lines) <= preset_index:
             lines += [""] * (preset_index + 1 - len(lines))
-        lines[preset_index] = payload if payload is not None else ""
+        lines[preset_index] = payload
 
-        try:
-            with open(localconfig, 'w', encoding='utf-8') as f:
-                for line in lines:
-                    f.write(line + "\n")
-            return True
-        except Exception:
-            return False
+        return localconfig.write_lines(lines)
 
     def LoadPreset(self, slot):
         """Load the preset payload from a slot.
@@ -143,44 +151,11 @@ class Chivalry:
         @param slot: The slot to load from (0-9)
         @returns: The stored payload (string) or None if not found
         """
-        import os
-
-        localconfig = "localconfig"
-
-        if not os.path.exists(localconfig):
-            return None
-
-        try:
-            with open(localconfig, 'r', encoding='utf-8') as f:
-                lines = f.read().strip().split('\n')
-                preset_line_index = 3 + slot
-                if len(lines) > preset_line_index and lines[preset_line_index].strip():
-                    return lines[preset_line_index]
-                return None
-        except Exception:
-            return None
+        return _getPresets().get(int(slot))
 
     def GetAllPresets(self):
         """Get all saved presets as a dictionary.
 
         @returns: Dictionary with slot numbers as keys and payload strings as values
         """
-        import os
-
-        localconfig = "localconfig"
-        presets = {}
-
-        if not os.path.exists(localconfig):
-            return presets
-
-        try:
-            with open(localconfig, 'r', encoding='utf-8') as f:
-                lines = f.read().strip().split('\n')
-                for i in range(10):
-                    preset_line_index = 3 + i
-                    if len(lines) > preset_line_index and lines[preset_line_index].strip():
-                        presets[str(i)] = lines[preset_line_index]
-        except Exception:
-            pass
-
-        return presets
\ No newline at end of file
+        return {str(slot): payload for slot, payload in sorted(_getPresets().items())}
@@ -1,7 +1,10 @@
 """Clean, reliable input system for Chivalry 2 console operations."""
 
+import ctypes
+from ctypes import wintypes
 from time import sleep
 import win32api, win32con
+from . import localconfig
 
 KEY_PRESS_DURATION = 0.01
 KEY_SEQUENCE_DELAY = 0.01
@@ -9,6 +12,54 @@ COMMAND_COMPLETION_DELAY = 0.0
 
 _console_key_cache = None
 
+# VkKeyScan results for code points 0..127, keyed by keyboard layout handle
+_vkscan_cache = {}
+
+INPUT_KEYBOARD = 1
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", wintypes.WPARAM)]
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", wintypes.WPARAM)]
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it has to be present so sizeof(INPUT) matches what SendInput expects
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+_SendInput = ctypes.windll.user32.SendInput
+_SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+_SendInput.restype = wintypes.UINT
+
+def _getVkScanTable():
+    """Return the VkKeyScan results for ASCII on the current keyboard layout.
+
+    The table is built once per layout, so switching layouts at runtime just adds an entry.
+    """
+    layout_id = win32api.GetKeyboardLayout(0)
+    table = _vkscan_cache.get(layout_id)
+    if table is None:
+        table = tuple(win32api.VkKeyScan(chr(c)) for c in range(128))
+        _vkscan_cache[layout_id] = table
+    return table
+
+def _vkScan(char, table):
+    """VkKeyScan for char, served from table for ASCII characters."""
+    code = ord(char)
+    return table[code] if code < 128 else win32api.VkKeyScan(char)
+
 def sendKeyPress(vk_code):
     """Send a single key press with reliable timing.
 
@@ -65,7 +116,7 @@ def sendCharacter(char):
     @param char: Single character to send
     """
     try:
-        vk_result = win32api.VkKeyScan(char)
+        vk_result = _vkScan(char, _getVkScanTable())
 
         if vk_result == -1:
             print(f"[INPUT] ERROR: Character '{char}' not found on current layout")
@@ -102,6 +153,60 @@ def sendString(text):
 
     return success
 
+def sendStringFast(text):
+    """Send a string of characters followed by Enter in a single SendInput call.
+
+    Unlike sendString this does not sleep between keystrokes: every key down/up (and the shift
+        presses around shifted characters) is queued into one INPUT array and injected atomically.
+        Falls back to sendString if SendInput rejects the batch.
+
+    @param text: String to type
+    """
+    table = _getVkScanTable()
+    events = []
+    success = True
+    for char in text:
+        vk_result = _vkScan(char, table)
+        if vk_result == -1:
+            print(f"[INPUT] ERROR: Character '{char}' not found on current layout")
+            success = False
+            continue
+
+        vk_code = vk_result & 0xFF
+        if (vk_result >> 8) & 1:
+            events += [(win32con.VK_LSHIFT, 0), (vk_code, 0), (vk_code, win32con.KEYEVENTF_KEYUP),
+                       (win32con.VK_LSHIFT, win32con.KEYEVENTF_KEYUP)]
+        else:
+            events += [(vk_code, 0), (vk_code, win32con.KEYEVENTF_KEYUP)]
+
+    events += [(win32con.VK_RETURN, 0), (win32con.VK_RETURN, win32con.KEYEVENTF_KEYUP)]
+
+    inputs = (_INPUT * len(events))()
+    for entry, (vk_code, flags) in zip(inputs, events):
+        entry.type = INPUT_KEYBOARD
+        entry.u.ki.wVk = vk_code
+        entry.u.ki.dwFlags = flags
+
+    sent = _SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+    if sent == 0:
+        print("[INPUT] SendInput rejected the batch, falling back to sendString")
+        return sendString(text)
+    if sent != len(inputs):
+        print(f"[INPUT] ERROR: SendInput injected only {sent}/{len(inputs)} events")
+        # The batch may have been cut between a key down and its key up; release the keys that
+        # could otherwise stay held in the game.
+        last_vk, last_flags = events[sent - 1]
+        if not last_flags & win32con.KEYEVENTF_KEYUP:
+            win32api.keybd_event(last_vk, 0, win32con.KEYEVENTF_KEYUP)
+        win32api.keybd_event(win32con.VK_LSHIFT, 0, win32con.KEYEVENTF_KEYUP)
+        win32api.keybd_event(win32con.VK_RETURN, 0, win32con.KEYEVENTF_KEYUP)
+        return False
+
+    if COMMAND_COMPLETION_DELAY > 0:
+        sleep(COMMAND_COMPLETION_DELAY)
+
+    return success
+
 def getConsoleKey():
     """Return configured console key if present, else detect by layout.
 
@@ -113,19 +218,14 @@ def getConsoleKey():
         return _console_key_cache
 
     try:
-        import os
-        cfg_path = os.path.join(os.getcwd(), "localconfig")
-        if os.path.exists(cfg_path):
-            try:
-                with open(cfg_path, 'r', encoding='utf-8') as f:
-                    lines = f.read().splitlines()
-                if len(lines) > 26 and lines[26].strip():
-                    vk_val = int(lines[26].strip())
-                    result = (None, vk_val)
-                    _console_key_cache = result
-                    return result
-            except Exception:
-                pass
+        try:
+            configured = localconfig.get_line(localconfig.CONSOLE_VK_INDEX)
+            if configured:
+                result = (None, int(configured))
+                _console_key_cache = result
+                return result
+        except ValueError:
+            pass
 
         layout_id = win32api.GetKeyboardLayout(0)
         lang_id = layout_id & 0xFFFF
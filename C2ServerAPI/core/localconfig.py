@@ -0,0 +1,86 @@
+"""Shared, cached access to the line-indexed localconfig file.
+
+localconfig layout:
+0: primary webhook
+1: secondary webhook
+2: discord user id
+3..12: 10 preset lines
+13: theme
+14..19: last used ban/kick/admin/add time values
+20..22: admin presets
+23..25: server presets
+26: console key VK
+"""
+
+import os
+
+PATH = "localconfig"
+PRESET_BASE_INDEX = 3
+PRESET_COUNT = 10
+CONSOLE_VK_INDEX = 26
+
+# Last parsed file as ((mtime_ns, size), lines). The dashboard, the preset helpers and the input
+# library all read this file; any write (here or by hand) changes the key and forces a reload.
+_cache = None
+
+
+def read_lines():
+    """Return a copy of the lines of localconfig, or [] if it can't be read."""
+    global _cache
+    try:
+        st = os.stat(PATH)
+        key = (st.st_mtime_ns, st.st_size)
+        if _cache is not None and _cache[0] == key:
+            return list(_cache[1])
+        with open(PATH, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        _cache = (key, lines)
+        return list(lines)
+    except Exception:
+        return []
+
+
+def get_line(index, default=""):
+    """Return the stripped line at index, or default if the file is shorter or the line is blank."""
+    lines = read_lines()
+    if len(lines) > index and lines[index].strip():
+        return lines[index].strip()
+    return default
+
+
+def write_lines(lines):
+    """Atomically replace localconfig with lines (in place if the file can't be swapped).
+
+    @returns: True on success
+    """
+    global _cache
+    _cache = None
+    # Serialize once, write once, then swap in atomically so a crash can't leave a torn file.
+    data = "".join(line + "\n" for line in lines)
+    tmp = PATH + ".tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.replace(tmp, PATH)
+        except PermissionError:
+            # Windows refuses the swap while another process (antivirus, sync client) holds
+            # localconfig open without share-delete; writing in place still works there.
+            with open(PATH, 'w', encoding='utf-8') as f:
+                f.write(data)
+    except Exception:
+        return False
+    finally:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+    try:
+        st = os.stat(PATH)
+        _cache = ((st.st_mtime_ns, st.st_size), list(lines))
+    except OSError:
+        pass
+    return True
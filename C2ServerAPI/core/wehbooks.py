@@ -1,16 +1,20 @@
+import os
 import discord
 from discord import SyncWebhook, Embed
 import datetime
-import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QInputDialog, QMessageBox, QApplication
+from . import localconfig
 
 webhook_primary = None
 webhook_secondary = None
 
+# Webhook posts are blocking HTTP calls; run them off the UI thread.
+# A single worker keeps notifications in the order the actions were taken.
+_send_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook")
+
 def load_config_from_file():
     """Load configuration from localconfig file"""
-    localconfig = "localconfig"
-
     config = {
         'primary_url': None,
         'secondary_url': None,
@@ -18,21 +22,21 @@ def load_config_from_file():
         'file_exists': False
     }
 
-    if os.path.exists(localconfig):
-        config['file_exists'] = True
-        try:
-            with open(localconfig, 'r', encoding='utf-8') as f:
-                lines = f.read().strip().split('\n')
-                if len(lines) >= 1 and lines[0] != "None":
-                    if lines[0].startswith("https://discord.com/api/webhooks/"):
-                        config['primary_url'] = lines[0]
-                if len(lines) >= 2 and lines[1] != "None":
-                    if lines[1].startswith("https://discord.com/api/webhooks/"):
-                        config['secondary_url'] = lines[1]
-                if len(lines) >= 3 and lines[2] != "None":
-                    config['discord_user_id'] = lines[2]
-        except Exception:
-            pass
+    if not localconfig.read_lines():
+        # Empty and missing both read as no lines; only a missing file triggers the setup prompt
+        config['file_exists'] = os.path.exists(localconfig.PATH)
+        return config
+    config['file_exists'] = True
+
+    primary_url = localconfig.get_line(0)
+    if primary_url.startswith("https://discord.com/api/webhooks/"):
+        config['primary_url'] = primary_url
+    secondary_url = localconfig.get_line(1)
+    if secondary_url.startswith("https://discord.com/api/webhooks/"):
+        config['secondary_url'] = secondary_url
+    discord_user_id = localconfig.get_line(2)
+    if discord_user_id and discord_user_id != "None":
+        config['discord_user_id'] = discord_user_id
 
     return config
 
@@ -131,20 +135,18 @@ def prompt_for_initial_setup():
 
 def save_initial_config(primary_url, secondary_url, discord_user_id):
     """Save initial configuration to localconfig file"""
-    localconfig = "localconfig"
-    try:
-        with open(localconfig, 'w', encoding='utf-8') as f:
-            f.write(f"{primary_url if primary_url else 'None'}\n")
-            f.write(f"{secondary_url if secondary_url else 'None'}\n")
-            f.write(f"{discord_user_id if discord_user_id else 'None'}\n")
-            for _ in range(10):
-                f.write("\n")
-            f.write("dark\n")
-    except Exception as e:
+    lines = [
+        primary_url if primary_url else 'None',
+        secondary_url if secondary_url else 'None',
+        discord_user_id if discord_user_id else 'None',
+    ]
+    lines += [""] * localconfig.PRESET_COUNT
+    lines.append("dark")
+    if not localconfig.write_lines(lines):
         QMessageBox.warning(
             None,
             "Save Error",
-            f"Unable to save initial configuration:\n{str(e)}"
+            f"Unable to save initial configuration to {localconfig.PATH}"
         )
 
     return primary_url, secondary_url
@@ -256,16 +258,20 @@ def MessageForAdmin(user_id, username, reason, duration_or_msg, category):
 
     embed.set_footer(text="AdminDashboard")
 
-    if webhook_primary:
+    _send_executor.submit(_send_embed, webhook_primary, webhook_secondary, embed, category)
+
+def _send_embed(primary, secondary, embed, category):
+    """Post an embed to the configured webhooks (runs on the webhook worker thread)"""
+    if primary:
         try:
-            webhook_primary.send(username="Admin Bot", embed=embed)
+            primary.send(username="Admin Bot", embed=embed)
             print(f"[WEBHOOK] Primary Discord notification sent for {category}")
         except Exception as e:
             print(f"[WEBHOOK] Failed to send primary Discord notification: {str(e)}")
 
-    if webhook_secondary:
+    if secondary:
         try:
-            webhook_secondary.send(username="Admin Bot", embed=embed)
+            secondary.send(username="Admin Bot", embed=embed)
             print(f"[WEBHOOK] Secondary Discord notification sent for {category}")
         except Exception as e:
             print(f"[WEBHOOK] Failed to send secondary Discord notification: {str(e)}")
@@ -9,12 +9,14 @@ from PyQt5.QtCore import Qt, QTimer, QAbstractNativeEventFilter, QAbstractEventD
 
 import pyperclip
 import os
+import queue
 import win32gui
 import re
 
 
 from core.C2ServerAPIExample import GameChivalry
 import core.wehbooks as wehbooks
+import core.localconfig as localconfig_store
 import ctypes
 import ctypes.wintypes as wintypes
 
@@ -1592,22 +1594,14 @@ class AdminDashboard(QWidget):
 
     def configure_discord_webhook(self):
         """Allow user to reconfigure Discord webhooks"""
-        import os
 
         # Get current webhook URLs if they exist
-        current_primary_url = ""
-        current_secondary_url = ""
-        localconfig = "localconfig"
-        if os.path.exists(localconfig):
-            try:
-                with open(localconfig, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    if len(lines) >= 1 and lines[0] != "None":
-                        current_primary_url = lines[0]
-                    if len(lines) >= 2 and lines[1] != "None":
-                        current_secondary_url = lines[1]
-            except Exception:
-                pass
+        current_primary_url = localconfig_store.get_line(0)
+        if current_primary_url == "None":
+            current_primary_url = ""
+        current_secondary_url = localconfig_store.get_line(1)
+        if current_secondary_url == "None":
+            current_secondary_url = ""
 
         # Prompt for primary webhook URL
         primary_url, ok = self.prompt_wide_text(
@@ -1654,10 +1648,7 @@ class AdminDashboard(QWidget):
         # Save the URLs to file, preserving all other lines in localconfig
         try:
             # Read all existing lines
-            lines = []
-            if os.path.exists(localconfig):
-                with open(localconfig, 'r', encoding='utf-8') as f:
-                    lines = f.read().splitlines()
+            lines = read_localconfig_lines()
             # Ensure at least 3 header lines and 10 preset lines
             min_len = 13
             if len(lines) < min_len:
@@ -1669,9 +1660,8 @@ class AdminDashboard(QWidget):
             if len(lines) < 3:
                 lines += ["None"] * (3 - len(lines))
             # Write all lines back
-            with open(localconfig, 'w', encoding='utf-8') as f:
-                for line in lines:
-                    f.write(line + "\n")
+            if not write_localconfig_lines(lines):
+                raise OSError(f"Could not write {localconfig_store.PATH}")
 
             # Reinitialize webhooks
             webhook_initialized = wehbooks.initialize_webhook()
@@ -1717,19 +1707,11 @@ class AdminDashboard(QWidget):
 
     def configure_discord_user_id(self):
         """Allow user to configure Discord User ID"""
-        import os
 
         # Get current Discord user ID if it exists
-        current_discord_user_id = ""
-        localconfig = "localconfig"
-        if os.path.exists(localconfig):
-            try:
-                with open(localconfig, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    if len(lines) >= 3 and lines[2] != "None":
-                        current_discord_user_id = lines[2]
-            except Exception:
-                pass
+        current_discord_user_id = localconfig_store.get_line(2)
+        if current_discord_user_id == "None":
+            current_discord_user_id = ""
 
         # Prompt for new Discord user ID
         discord_user_id, ok = QInputDialog.getText(
@@ -1749,10 +1731,7 @@ class AdminDashboard(QWidget):
         # Save the Discord user ID to file, preserving all other lines
         try:
             # Read all existing lines
-            lines = []
-            if os.path.exists(localconfig):
-                with open(localconfig, 'r', encoding='utf-8') as f:
-                    lines = f.read().splitlines()
+            lines = read_localconfig_lines()
             # Ensure at least 3 header lines and 10 preset lines
             min_len = 13
             if len(lines) < min_len:
@@ -1766,9 +1745,8 @@ class AdminDashboard(QWidget):
                 lines.append('None')
             lines[2] = discord_user_id if discord_user_id else 'None'
             # Write all lines back
-            with open(localconfig, 'w', encoding='utf-8') as f:
-                for line in lines:
-                    f.write(line + "\n")
+            if not write_localconfig_lines(lines):
+                raise OSError(f"Could not write {localconfig_store.PATH}")
 
             if discord_user_id:
                 QMessageBox.information(
@@ -2148,22 +2126,10 @@ class FirstToScoreboardWindow(QDialog):
 
 # ---- Persistent last-used parameters (ban/kick/admin/server/add time) ----
 
-def read_localconfig_lines():
-    try:
-        with open("localconfig", 'r', encoding='utf-8') as f:
-            return f.read().splitlines()
-    except Exception:
-        return []
-
-
-def write_localconfig_lines(lines):
-    try:
-        with open("localconfig", 'w', encoding='utf-8') as f:
-            for line in lines:
-                f.write(line + "\n")
-        return True
-    except Exception:
-        return False
+# Reads are cached on the file's (mtime_ns, size) and shared with the core modules, so preset
+# tooltips, persisted values and the input library only hit the disk after a change.
+read_localconfig_lines = localconfig_store.read_lines
+write_localconfig_lines = localconfig_store.write_lines
 
 
 # localconfig layout:
@@ -2251,46 +2217,25 @@ def set_server_preset(slot: int, value: str) -> None:
 
 def load_theme_preference():
     """Load theme preference from localconfig file"""
-    import os
-    localconfig = "localconfig"
-    if os.path.exists(localconfig):
-        try:
-            with open(localconfig, 'r', encoding='utf-8') as f:
-                lines = f.read().strip().split('\n')
-                # Theme preference is stored on line 14 (index 13)
-                if len(lines) >= 14 and lines[13].strip():
-                    return lines[13].strip().lower() == 'dark'
-        except Exception:
-            pass
+    # Theme preference is stored on line 14 (index 13)
+    theme = localconfig_store.get_line(13)
+    if theme:
+        return theme.lower() == 'dark'
     return True  # Default to dark theme
 
 def save_theme_preference(is_dark_theme):
     """Save theme preference to localconfig file"""
-    import os
-    localconfig = "localconfig"
-
     # Read existing configuration
-    lines = ['None'] * 14  # Initialize with 14 lines
-    if os.path.exists(localconfig):
-        try:
-            with open(localconfig, 'r', encoding='utf-8') as f:
-                existing_lines = f.read().strip().split('\n')
-                for i, line in enumerate(existing_lines):
-                    if i < 14:
-                        lines[i] = line
-        except Exception:
-            pass
+    lines = read_localconfig_lines()
+    if len(lines) < 14:
+        lines += ['None'] * (14 - len(lines))
 
     # Set theme preference on line 14 (index 13)
     lines[13] = 'dark' if is_dark_theme else 'light'
 
     # Write back to file
-    try:
-        with open(localconfig, 'w', encoding='utf-8') as f:
-            for line in lines:
-                f.write(f"{line}\n")
-    except Exception as e:
-        print(f"[THEME] Failed to save theme preference: {e}")
+    if not write_localconfig_lines(lines):
+        print("[THEME] Failed to save theme preference")
 
 def apply_dark_theme(app):
     """Apply a dark theme to the entire application"""
@@ -2628,10 +2573,48 @@ def apply_light_theme(app):
 
     app.setStyleSheet(light_stylesheet)
 
+def watch_update_check(app, parent, result_queue):
+    """Poll the background update check and offer to install the update once it is known."""
+    timer = QTimer(parent)
+    timer.setInterval(250)
+
+    def _poll():
+        try:
+            pick = result_queue.get_nowait()
+        except queue.Empty:
+            return
+        timer.stop()
+        if not pick:
+            return
+
+        latest = pick.get("remote_id") or pick.get("release_tag") or "unknown"
+        reply = QMessageBox.question(
+            parent,
+            "Update available",
+            f"A new version of AdminDashboard is available ({latest}).\n\n"
+            "Install it now? The dashboard will restart.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        try:
+            from core import autoupdater
+            if autoupdater.spawn_updater(pick):
+                app.quit()
+        except Exception as e:
+            print(f"[UPDATE] Failed to start updater: {e}")
+
+    timer.timeout.connect(_poll)
+    timer.start()
+    return timer
+
 def main():
     # ---- Auto-update (Windows packaged .exe only) ----
-    # If an update is available, a temporary updater copy of this executable is spawned,
-    # this process exits, the updater replaces the old .exe, and then relaunches the app.
+    # The update check runs in the background; if an update is available and the user accepts it,
+    # a temporary updater copy of this executable is spawned, this process exits, the updater
+    # replaces the old .exe, and then relaunches the app.
     #
     # NOTE: The updater process itself runs this same entrypoint with '--apply-update'.
     # In that mode we do NOT start the full dashboard UI.
@@ -2647,49 +2630,17 @@ def main():
 
     app = QApplication(sys.argv)
 
-    update_dialog = None
-    update_label = None
+    # Normal mode: the update check runs on a background thread so the UI starts immediately;
+    # the result is picked up once the dashboard is shown (see watch_update_check).
+    update_queue = None
     try:
-        is_frozen = bool(getattr(sys, "frozen", False))
-        if is_frozen and ("--skip-update" not in sys.argv):
-            update_dialog = QDialog()
-            update_dialog.setWindowTitle("AdminDashboard")
-            update_dialog.setFixedSize(460, 130)
-
-            layout = QVBoxLayout(update_dialog)
-            update_label = QLabel("Checking for updates...")
-            update_label.setWordWrap(True)
-            bar = QProgressBar()
-            bar.setRange(0, 0)
-            layout.addWidget(update_label)
-            layout.addWidget(bar)
-            update_dialog.show()
-            app.processEvents()
-
-            def _update_status(msg: str) -> None:
-                if update_label is not None:
-                    update_label.setText(str(msg))
-                app.processEvents()
-
-            from core import autoupdater
-            if autoupdater.handle_update_flow(status_callback=_update_status):
-                try:
-                    app.processEvents()
-                except Exception:
-                    pass
-                sys.exit(0)
+        from core import autoupdater
+        update_queue = autoupdater.start_update_check()
     except Exception as e:
         try:
             print(f"[UPDATE] Auto-update skipped/failed: {e}")
         except Exception:
             pass
-    finally:
-        try:
-            if update_dialog is not None:
-                update_dialog.close()
-                app.processEvents()
-        except Exception:
-            pass
 
     app._instant_tt = InstantToolTipFilter(delay_ms=300)
     app.installEventFilter(app._instant_tt)
@@ -2718,6 +2669,8 @@ def main():
 
     window = AdminDashboard()
     window.show()
+    if update_queue is not None:
+        app._update_timer = watch_update_check(app, window, update_queue)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
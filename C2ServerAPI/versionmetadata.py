@@ -1,53 +1,25 @@
+import mmap
 import os
 import re
 
-full_version = None
-
-_version_line_re = re.compile(r"^\s*version\s*=\s*['\"]([^'\"]+)['\"]\s*$")
-
-with open("pyproject.toml", "r", encoding="utf-8") as f:
-    in_poetry = False
-    for line in f:
-        s = line.strip()
-        if s == "[tool.poetry]":
-            in_poetry = True
-            continue
-        if s.startswith("[") and s.endswith("]") and s != "[tool.poetry]":
-            in_poetry = False
-        if not in_poetry:
-            continue
-        m = _version_line_re.match(line)
-        if m:
-            full_version = m.group(1)
-            break
-
-if full_version is None:
-    raise RuntimeError("Could not find [tool.poetry].version in pyproject.toml")
-
-semver_match = re.search(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?", full_version)
-if not semver_match:
-    raise RuntimeError(f"Version '{full_version}' is not in a supported format (expected X.Y.Z or X.Y.Z.W)")
-
-a, b, c, d = semver_match.groups()
-file_version = f"{int(a)}.{int(b)}.{int(c)}.{int(d or 0)}"
-
-print(f"Building version metadata for {file_version}")
-
-if not os.path.exists("build"):
-    os.mkdir("build")
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
-company_name = "OVA"
-file_description = "Chivalry 2 Admin Dashboard"
-internal_name = "AdminDashboard"
-original_filename = "AdminDashboard.exe"
-product_name = "Chiv2 Admin Dashboard"
+# [tool.poetry] header, then anything up to the next table header, then its version key
+_poetry_version_re = re.compile(
+    rb"^[ \t]*\[tool\.poetry\][ \t]*\r?$(?:(?!^[ \t]*\[).)*?^[ \t]*version[ \t]*=[ \t]*['\"]([^'\"]+)['\"][ \t]*\r?$",
+    re.MULTILINE | re.DOTALL,
+)
+_semver_re = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?")
 
-version_info_path = os.path.join("build", "versionfile.txt")
-version_info_content = f"""# UTF-8
+# PyInstaller version resource; filled in with str.format once the version is known
+_VERSIONFILE_TEMPLATE = """# UTF-8
 VSVersionInfo(
   ffi=FixedFileInfo(
-    filevers=({int(a)}, {int(b)}, {int(c)}, {int(d or 0)}),
-    prodvers=({int(a)}, {int(b)}, {int(c)}, {int(d or 0)}),
+    filevers={filevers},
+    prodvers={prodvers},
     mask=0x3f,
     flags=0x0,
     OS=0x40004,
@@ -77,7 +49,79 @@ VSVersionInfo(
 )
 """
 
-with open(version_info_path, "w", encoding="utf-8") as f:
-    f.write(version_info_content)
+if not os.path.exists("build"):
+    os.mkdir("build")
+
+# The version read from pyproject.toml is cached next to the build output, keyed on the file's
+# mtime and size, so repeated builds skip the scan until pyproject.toml is edited.
+version_cache_path = os.path.join("build", ".version.cache")
+pyproject_stat = os.stat("pyproject.toml")
+cache_key = f"{pyproject_stat.st_mtime_ns}:{pyproject_stat.st_size}"
+
+full_version = None
+try:
+    with open(version_cache_path, "r", encoding="utf-8") as f:
+        cached = f.read().splitlines()
+    if len(cached) >= 2 and cached[0] == cache_key:
+        full_version = cached[1]
+except OSError:
+    pass
+
+if full_version is None:
+    if tomllib is not None:
+        with open("pyproject.toml", "rb") as f:
+            full_version = tomllib.load(f).get("tool", {}).get("poetry", {}).get("version")
+    else:
+        with open("pyproject.toml", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            m = _poetry_version_re.search(mm)
+            if m:
+                full_version = m.group(1).decode("utf-8")
+
+    if full_version is None:
+        raise RuntimeError("Could not find [tool.poetry].version in pyproject.toml")
+
+    with open(version_cache_path, "w", encoding="utf-8") as f:
+        f.write(f"{cache_key}\n{full_version}\n")
+
+semver_match = _semver_re.search(full_version)
+if not semver_match:
+    raise RuntimeError(f"Version '{full_version}' is not in a supported format (expected X.Y.Z or X.Y.Z.W)")
+
+a, b, c, d = semver_match.groups()
+version_tuple = (int(a), int(b), int(c), int(d or 0))
+file_version = "{}.{}.{}.{}".format(*version_tuple)
+
+print(f"Building version metadata for {file_version}")
+
+company_name = "OVA"
+file_description = "Chivalry 2 Admin Dashboard"
+internal_name = "AdminDashboard"
+original_filename = "AdminDashboard.exe"
+product_name = "Chiv2 Admin Dashboard"
+
+version_info_path = os.path.join("build", "versionfile.txt")
+version_info_content = _VERSIONFILE_TEMPLATE.format(
+    filevers=version_tuple,
+    prodvers=version_tuple,
+    company_name=company_name,
+    file_description=file_description,
+    file_version=file_version,
+    internal_name=internal_name,
+    original_filename=original_filename,
+    product_name=product_name,
+)
+
+try:
+    with open(version_info_path, "r", encoding="utf-8") as f:
+        existing_content = f.read()
+except FileNotFoundError:
+    existing_content = None
+
+# Leave an identical file alone so its mtime doesn't make PyInstaller think it changed
+if existing_content == version_info_content:
+    print(f"PyInstaller version file is up to date: {version_info_path}")
+else:
+    with open(version_info_path, "w", encoding="utf-8") as f:
+        f.write(version_info_content)
 
-print(f"Wrote PyInstaller version file: {version_info_path}")
\ No newline at end of file
+    print(f"Wrote PyInstaller version file: {version_info_path}")
\ No newline at end of file